@@ -5,10 +5,8 @@ from __future__ import annotations
 import sys
 
 import click
-from PySide6.QtWidgets import QApplication
 
 from ffmpeg_py_gui._internal import debug
-from ffmpeg_py_gui.gui.user_interface import UserInterface
 
 
 def debug_info_callback(ctx: click.Context, param: click.Parameter, value: bool) -> None:
@@ -43,6 +41,12 @@ def main(gui: bool) -> None:
         gui (bool): Whether to run the GUI. Defaults to False.
     """
     if gui:
+        # Qt and the window are only loaded when needed, to keep --help/--version/--debug-info fast
+        # pylint: disable=import-outside-toplevel
+        from PySide6.QtWidgets import QApplication  # noqa: PLC0415
+
+        from ffmpeg_py_gui.gui.user_interface import UserInterface  # noqa: PLC0415
+
         app = QApplication(sys.argv)
         window = UserInterface()
         window.show()
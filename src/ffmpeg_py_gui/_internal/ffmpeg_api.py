@@ -1,12 +1,74 @@
 """Module for interacting with ffmpeg/ffprobe commands."""
 
+import os
 import re
+import selectors
 import subprocess
+import time
 import json  # Import inside method if needed
+from collections import deque
 from collections.abc import Callable
-from typing import Any
-
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from typing import Any, NamedTuple
+
+from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
+
+_json_loads: Callable[[bytes], Any]
+try:
+    # Optional (the fast-json extra), decodes large ffprobe outputs several times faster
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+\.\d+)")
+
+# Size of each read from the process pipe
+_READ_SIZE = 1 << 16
+# Output lines are sent to the UI in batches, flushed when either limit is hit
+# The latest progress value goes out with the timed flush, so the UI gets at most 20 updates per second
+_LOG_BATCH_SIZE = 64
+_LOG_BATCH_INTERVAL = 0.05  # seconds
+# Keys of a -progress block; stdout and stderr share the pipe, so any other key=value line is log output
+# Per-stream quality keys are named stream_<file>_<stream>_q and checked separately
+_PROGRESS_KEYS = frozenset(
+    {
+        "frame",
+        "fps",
+        "bitrate",
+        "total_size",
+        "out_time_us",
+        "out_time_ms",
+        "out_time",
+        "dup_frames",
+        "drop_frames",
+        "speed",
+        "progress",
+    },
+)
+# Smallest progress change worth a repaint of the progress bar (0.5%)
+_PROGRESS_STEP = 0.005
+
+
+class CodecInfo(NamedTuple):
+    """One entry of the `ffmpeg -encoders` table."""
+
+    codec: str
+    flags: str
+    description: str
+
+
+class _ReadBuffers(NamedTuple):
+    """Buffers of the output read loop, handed from one job to the next."""
+
+    io_buffer: bytearray  # the pipe is read into this fixed buffer
+    accumulator: bytearray  # reads are appended here, it keeps the incomplete last line
+    pending: deque[str]  # complete lines waiting for the line parser
+
+    @classmethod
+    def allocate(cls) -> "_ReadBuffers":
+        """Allocate a new set of buffers."""
+        return cls(bytearray(_READ_SIZE), bytearray(), deque())
 
 
 class FFmpegWorker(QObject):
@@ -15,62 +77,190 @@ class FFmpegWorker(QObject):
     """
 
     finished = Signal(int)  # exit code
-    output_line = Signal(str)  # raw stdout/stderr line
+    output_lines = Signal(list)  # batch of raw stdout/stderr lines
     progress = Signal(float)  # 0.0 - 1.0 (for live progress cases)
     result = Signal(object)  # generic result (e.g. codec list)
     error = Signal(str)
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         command: list[str],
-        line_parser: Callable[[str], None] | None = None,
-        final_parser: Callable[[list[str], int], Any] | None = None,
+        line_parser: Callable[[str], bool | None] | None = None,
+        final_parser: Callable[[list[str], int], Any] | Callable[[bytes, int], Any] | None = None,
+        *,
+        prepare: Callable[[], None] | None = None,
+        binary_capture: bool = False,
+        buffer_pool: deque[_ReadBuffers] | None = None,
     ) -> None:
+        """Set up the worker.
+
+        Args:
+            command (list[str]): Command to run.
+            line_parser: Called for every output line, return a truthy value to keep the line out of the log.
+            final_parser: Called with the collected output and the exit code, its return value is emitted as result.
+            prepare: Called in the worker thread before the command is started, for slow setup like probing.
+            binary_capture (bool): Read the whole output in one go and hand the raw bytes to the final parser,
+                without emitting any output lines. Meant for commands with machine-readable output like ffprobe.
+            buffer_pool (deque[_ReadBuffers] | None): Read buffers to borrow from and give back after the command,
+                a set is allocated when it is empty.
+        """
         super().__init__()
         self.command = command
         self.line_parser = line_parser or (lambda line: None)  # default: do nothing
         self.final_parser = final_parser
+        self.prepare = prepare
+        self.binary_capture = binary_capture
+        # Output is only kept around for the final parser, a conversion doesn't need it
+        self._collect = final_parser is not None
         self._collected_lines: list[str] = []
         self._is_running = True
+        self._last_progress = 0.0
+        self._pending_progress: float | None = None
+        self._buffer_pool: deque[_ReadBuffers] = buffer_pool if buffer_pool is not None else deque()
 
     @Slot()
     def run(self) -> None:
         """Executed inside worker thread."""
         try:
-            process = subprocess.Popen(
+            if self.prepare is not None:
+                self.prepare()
+            with subprocess.Popen(
                 self.command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-            )
-
-            assert process.stdout is not None
-
-            for line in process.stdout:
-                if not self._is_running:
-                    process.kill()
-                    break
-
-                line = line.rstrip("\r\n")
-                self._collected_lines.append(line)
-                self.output_line.emit(line)
+                bufsize=0,
+            ) as process:
+                assert process.stdout is not None
 
-                # Let the custom line parser do its job (progress, partial results, etc.)
-                self.line_parser(line)
+                output: list[str] | bytes
+                if self.binary_capture:
+                    output = process.stdout.read()
+                else:
+                    self._pump_lines(process)
+                    output = self._collected_lines
 
-            process.wait()
             exit_code = process.returncode
             self.finished.emit(exit_code)
 
             # Final parsing if provided
             if self.final_parser is not None:
-                parsed_result = self.final_parser(self._collected_lines, exit_code)
+                parsed_result = self.final_parser(output, exit_code)  # type: ignore[arg-type]
                 self.result.emit(parsed_result)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.error.emit(str(e))
 
+    def _pump_lines(self, process: subprocess.Popen[bytes]) -> None:
+        """Feed the process output line by line to the line parser and the log.
+
+        The pipe is drained without blocking as soon as data arrives, so the process never stalls on a full
+        pipe while lines are being parsed or sent to the UI.
+        """
+        # deque.pop() and append() are atomic, so workers running at the same time never get the same set
+        try:
+            buffers = self._buffer_pool.pop()
+        except IndexError:
+            buffers = _ReadBuffers.allocate()
+        try:
+            self._read_lines(process, buffers)
+        finally:
+            buffers.accumulator.clear()
+            buffers.pending.clear()
+            self._buffer_pool.append(buffers)
+
+    def _read_lines(self, process: subprocess.Popen[bytes], buffers: _ReadBuffers) -> None:
+        """Run the read loop of _pump_lines with the given buffers."""
+        if process.stdout is None:
+            msg = "process output is not a pipe"
+            raise RuntimeError(msg)
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+
+        buffer = memoryview(buffers.io_buffer)
+        accumulator = buffers.accumulator
+        pending = buffers.pending
+        batch: list[str] = []
+        last_flush = time.monotonic()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            eof = False
+            while not eof:
+                if not self._is_running:
+                    process.kill()
+                    break
+
+                # The timeout keeps stop() and the timed flush working while the process is quiet
+                if selector.select(_LOG_BATCH_INTERVAL):
+                    size = os.readv(fd, [buffer])
+                    if size:
+                        accumulator += buffer[:size]
+                        self._split_lines(accumulator, pending)
+                    else:
+                        eof = True
+                        if accumulator:
+                            pending.append(accumulator.decode("utf-8", "replace"))
+
+                while pending:
+                    line = pending.popleft()
+                    # Let the custom line parser do its job (progress, partial results, etc.),
+                    # a truthy return value means the line was consumed and is not logged
+                    if not self.line_parser(line):
+                        if self._collect:
+                            self._collected_lines.append(line)
+                        batch.append(line)
+
+                now = time.monotonic()
+                if now - last_flush > _LOG_BATCH_INTERVAL:
+                    self._flush_progress()
+                    if batch:
+                        self.output_lines.emit(batch)
+                        batch = []
+                    last_flush = now
+                elif len(batch) >= _LOG_BATCH_SIZE:
+                    self.output_lines.emit(batch)
+                    batch = []
+
+        if batch:
+            self.output_lines.emit(batch)
+        self._flush_progress()
+
+    @staticmethod
+    def _split_lines(data: bytearray, lines: deque[str]) -> None:
+        """Queue the complete lines found in data and remove them from it, in place.
+
+        The incomplete rest stays in data for the next read.
+        """
+        # A bare carriage return also ends a line, it is used by live status lines
+        end = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+        if not end:
+            return
+        complete = data[:end]
+        del data[:end]
+        # Split the bytes, str.splitlines() would also break at form feeds and other separators that can occur
+        # inside metadata or filter output
+        lines.extend(line.decode("utf-8", "replace") for line in complete.splitlines() if line)
+
+    def report_progress(self, value: float) -> None:
+        """Record progress, it is emitted with the next flush of the output lines.
+
+        Args:
+            value (float): Value between 0 and 1.
+        """
+        self._pending_progress = value
+
+    def _flush_progress(self) -> None:
+        """Emit the latest recorded progress, dropping updates too small to show on the progress bar."""
+        value = self._pending_progress
+        if value is None:
+            return
+        self._pending_progress = None
+        if value == self._last_progress:
+            return
+        if value < 1.0 and abs(value - self._last_progress) < _PROGRESS_STEP:
+            return
+        self._last_progress = value
+        self.progress.emit(value)
+
     def stop(self) -> None:
         """Stop the process."""
         self._is_running = False
@@ -84,7 +274,8 @@ class FFmpegBackend:
         self.ui = ui
         self.thread: QThread | None = None
         self.worker: FFmpegWorker | None = None
-        self._duration: float | None = None  # Temp storage for progress across lines
+        # Read buffers lent to the line reading workers, allocated by the first job and reused by the next ones
+        self._read_buffers: deque[_ReadBuffers] = deque()
 
     def _start_worker(self, worker: FFmpegWorker) -> None:
         """Common setup for starting a worker in a thread."""
@@ -99,10 +290,12 @@ class FFmpegBackend:
         self.worker.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
-        self.worker.progress.connect(self.ui.update_progress)
-        self.worker.output_line.connect(self.ui.append_log)
-        self.worker.error.connect(self.ui.show_error)
-        self.worker.finished.connect(self.ui.command_finished)
+        # The UI lives in another thread, so be explicit about queuing
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker.progress.connect(self.ui.update_progress, queued)
+        self.worker.output_lines.connect(self.ui.append_log_batch, queued)
+        self.worker.error.connect(self.ui.show_error, queued)
+        self.worker.finished.connect(self.ui.command_finished, queued)
 
         # If using result signal for codecs / ffprobe etc.
         # self.worker.result.connect(self.ui.handle_result)  # or specific handler
@@ -112,19 +305,45 @@ class FFmpegBackend:
     # Example: Run a conversion command with live progress parsing
     def run_conversion(self, input_file: str, output_file: str, hw_accel_args: list[str] = None,  extra_args: list[str] = None) -> None:
         """Run ffmpeg conversion with live progress."""
-        command = ["ffmpeg"]  + (hw_accel_args or []) + ["-i", input_file] + (extra_args or []) + [output_file]
+        # Machine-readable key=value progress on stdout instead of the human stats line
+        command = (
+            ["ffmpeg", "-nostats", "-progress", "pipe:1"]
+            + (hw_accel_args or [])
+            + ["-i", input_file]
+            + (extra_args or [])
+            + [output_file]
+        )
         print(command)
-
-        def line_parser(line: str) -> None:
-            if "Duration:" in line:
-                self._duration = self._parse_duration(line)
-            if "time=" in line and self._duration is not None:
-                current = self._parse_time(line)
-                if current is not None:
-                    progress = min(current / self._duration, 1.0)
-                    self.worker.progress.emit(progress)  # Emit via worker's signal
-
-        worker = FFmpegWorker(command, line_parser=line_parser)
+        # Per-conversion state lives in the closure, so concurrent or consecutive jobs can't mix it up
+        # It is kept in microseconds, the unit of out_time_us, so an update costs one int() and one division
+        duration_us = 0
+
+        def prepare() -> None:
+            # Runs in the worker thread, ffprobe can take a while on large or remote files
+            nonlocal duration_us
+            duration_us = self._to_microseconds(self._probe_duration(input_file))
+
+        def line_parser(line: str) -> bool:
+            nonlocal duration_us
+            key, _, value = line.partition("=")
+            if key == "out_time_us":
+                if duration_us and value.isdigit():
+                    progress = min(int(value) / duration_us, 1.0)
+                    worker.report_progress(progress)
+                return True
+            if key == "progress":
+                if value == "end":
+                    worker.report_progress(1.0)
+                return True
+            if key in _PROGRESS_KEYS or (key.startswith("stream_") and key.endswith("_q")):
+                # The rest of the -progress block (frame=, fps=, speed=, ...)
+                return True
+            if not duration_us and "Duration:" in line:
+                # ffprobe could not tell, fall back to the log header
+                duration_us = self._to_microseconds(self._parse_duration(line))
+            return False
+
+        worker = FFmpegWorker(command, line_parser=line_parser, prepare=prepare, buffer_pool=self._read_buffers)
         self._start_worker(worker)
 
     # Example: Run to get codecs with end-parsing
@@ -132,31 +351,14 @@ class FFmpegBackend:
         """Run ffmpeg -codecs and parse the full output at the end."""
         command = ["ffmpeg", "-encoders"]
 
-        def final_parser(lines: list[str], exit_code: int) -> list[dict] | None:
+        def final_parser(lines: list[str], exit_code: int) -> list[CodecInfo] | None:
             if exit_code != 0:
                 return None
-            codecs = []
-            start_reading = False
-            for line in lines:
-                clean_line = line.strip()
-                if clean_line.strip() == "------":
-                    start_reading = True
-                    continue
-                if not start_reading:
-                    continue
-                parts = line.split()
-                if len(parts) < 3:
-                    continue
-
-                flags = parts[0]  # "V....D" or " DEV.L." etc
-                codec_name = parts[1]  # "h264", "libx264", "aac", "a64multi"
-                # everything else is description
-                description = " ".join(parts[2:]).strip()
-                codecs.append({"codec": codec_name, "flags": flags, "description": description})
-            return codecs
-
-        worker = FFmpegWorker(command, final_parser=final_parser)
-        worker.result.connect(self.ui.update_codec_list)  # Assuming you add a UI method to handle the list
+            return self._parse_encoders(lines)
+
+        worker = FFmpegWorker(command, final_parser=final_parser, buffer_pool=self._read_buffers)
+        # Assuming you add a UI method to handle the list
+        worker.result.connect(self.ui.update_codec_list, Qt.ConnectionType.QueuedConnection)
         self._start_worker(worker)
 
     # Future example: Run ffprobe for file info, parse JSON at end
@@ -175,28 +377,62 @@ class FFmpegBackend:
             input_file,
         ]
 
-        def final_parser(lines: list[str], exit_code: int) -> dict | None:
+        def final_parser(stdout: bytes, exit_code: int) -> dict[str, Any] | None:
             if exit_code != 0:
                 return None
             try:
-                return json.loads("\n".join(lines))
-            except json.JSONDecodeError:
+                info: dict[str, Any] = _json_loads(stdout)
+            except json.JSONDecodeError:  # orjson's error type derives from it
                 return None
+            return info
 
-        worker = FFmpegWorker(command, final_parser=final_parser)
-        worker.result.connect(self.ui.display_file_info)  # Add your UI handler
+        worker = FFmpegWorker(command, final_parser=final_parser, binary_capture=True)
+        worker.result.connect(self.ui.display_file_info, Qt.ConnectionType.QueuedConnection)  # Add your UI handler
         self._start_worker(worker)
 
     # Helper parsers (can be shared or overridden)
-    def _parse_duration(self, line: str) -> float | None:
-        match = re.search(r"Duration: (\d+):(\d+):(\d+\.\d+)", line)
-        if match:
-            h, m, s = match.groups()
-            return int(h) * 3600 + int(m) * 60 + float(s)
-        return None
+    def _parse_encoders(self, lines: list[str]) -> list[CodecInfo]:
+        """Parse the encoder table printed by `ffmpeg -encoders`."""
+        codecs = []
+        start_reading = False
+        for line in lines:
+            if not start_reading:
+                start_reading = line.lstrip().startswith("------")
+                continue
+            # One pass into flags ("V....D"), name ("libx264") and the description
+            parts = line.split(None, 2)
+            if len(parts) < 3:
+                continue
+            flags, codec_name, description = parts
+            codecs.append(CodecInfo(codec_name, flags, description))
+        return codecs
+
+    def _probe_duration(self, input_file: str) -> float | None:
+        """Ask ffprobe for the duration of a file.
+
+        Args:
+            input_file (str): Path to the file.
+
+        Returns:
+            float | None: Duration in seconds, `None` if it cannot be determined.
+        """
+        command = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=nw=1:nk=1", input_file]
+        try:
+            # Fixed argument list without a shell, the file name is passed as a single argument
+            probe = subprocess.run(command, capture_output=True, encoding="utf-8", timeout=5, check=True)  # noqa: S603
+            return float(probe.stdout.strip())
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return None
+
+    @staticmethod
+    def _to_microseconds(seconds: float | None) -> int:
+        """Convert a duration to whole microseconds, 0 if unknown."""
+        return round(seconds * 1_000_000) if seconds else 0
 
-    def _parse_time(self, line: str) -> float | None:
-        match = re.search(r"time=(\d+):(\d+):(\d+\.\d+)", line)
+    def _parse_duration(self, line: str) -> float | None:
+        if "Duration:" not in line:
+            return None
+        match = _DURATION_RE.search(line)
         if match:
             h, m, s = match.groups()
             return int(h) * 3600 + int(m) * 60 + float(s)
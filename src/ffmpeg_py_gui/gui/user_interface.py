@@ -1,12 +1,35 @@
 """User interface for ffmpeg-py-gui."""
 
+import itertools
+import os
+import stat
+import sys
+from collections import deque
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
-from typing import Any
-
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QMovie, QResizeEvent
+from typing import Any, ClassVar
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRect,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QMouseEvent, QPainter, QPaintEvent, QPalette, QPen
 from PySide6.QtWidgets import (
     QAbstractItemView,
+    QApplication,
     QCheckBox,
     QColorDialog,
     QComboBox,
@@ -16,19 +39,40 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMainWindow,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
     QSlider,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+    QTableView,
     QTabWidget,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
-from ffmpeg_py_gui._internal.ffmpeg_api import FFmpegBackend
+from ffmpeg_py_gui._internal.ffmpeg_api import CodecInfo, FFmpegBackend
+
+# Files picked up from dialogs and dropped folders, a tuple so names can be matched with str.endswith()
+_VIDEO_SUFFIXES = (".mp4", ".mkv", ".avi", ".mov", ".webm", ".ts")
+
+_OVERLAY_QSS = "background-color: rgba(0, 0, 0, 120);"
+_OVERLAY_TEXT_QSS = "color: white; font-size: 16px;"
+
+
+def _add_labeled(layout: QVBoxLayout, label: str, widget: QWidget) -> None:
+    """Add a widget with a caption above it.
+
+    Args:
+        layout (QVBoxLayout): Layout to add both to.
+        label (str): Caption text.
+        widget (QWidget): Widget to add below the caption.
+    """
+    layout.addWidget(QLabel(label))
+    layout.addWidget(widget)
 
 
 # Global state
@@ -42,13 +86,18 @@ class UserInterface(QMainWindow):
 
         self.backend = FFmpegBackend(self)
 
-        self.codec_list = []  # type: ignore
+        # (text, codec name) combo entries, the filtered lists are built once per codec query
+        self.codec_list: list[tuple[str, str]] = []
+        self._vaapi_codecs: list[tuple[str, str]] = []
+        self._vulkan_codecs: list[tuple[str, str]] = []
         self.vaapi_device = "/dev/dri/renderD128"
 
         self.setWindowTitle("FFmpeg VA-API Converter")
         self.resize(1000, 700)
 
-        self.added_files: list[Path] = []
+        self.file_model = FileListModel()
+        # The model owns the list, this is the same object
+        self.added_files: list[Path] = self.file_model.files
 
         # Enable native drag & drop
         self.setAcceptDrops(True)
@@ -67,13 +116,15 @@ class UserInterface(QMainWindow):
 
         left_layout.addWidget(QLabel("Input Files"))
 
-        self.file_table = QTableWidget()
-        self.file_table.setColumnCount(3)
-        self.file_table.setHorizontalHeaderLabels(["Filename", "Size", ""])
+        self.file_table = QTableView()
+        self.file_table.setModel(self.file_model)
+        self.file_table.setItemDelegateForColumn(FileListModel.REMOVE_COLUMN, RemoveButtonDelegate(self.file_table))
         self.file_table.horizontalHeader().setSectionResizeMode(
             0,
             QHeaderView.ResizeMode.Stretch,
         )
+        # Uniform, fixed row heights let the view map scroll positions to rows without measuring any of them
+        self.file_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.file_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.file_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
@@ -108,19 +159,16 @@ class UserInterface(QMainWindow):
             ["Very Fast", "Fast", "Medium", "Slow", "Very Slow"],
         )
         self.preset_combo.setCurrentText("Medium")
-        tab1_layout.addWidget(QLabel("Preset"))
-        tab1_layout.addWidget(self.preset_combo)
+        _add_labeled(tab1_layout, "Preset", self.preset_combo)
 
         self.crf_spin = QSpinBox()
         self.crf_spin.setRange(0, 51)
         self.crf_spin.setValue(23)
-        tab1_layout.addWidget(QLabel("CRF"))
-        tab1_layout.addWidget(self.crf_spin)
+        _add_labeled(tab1_layout, "CRF", self.crf_spin)
         tab1_layout.addWidget(QLabel("(lower = better quality, larger file)"))
 
         self.codec_combo = QComboBox()
-        tab1_layout.addWidget(QLabel("Codec"))
-        tab1_layout.addWidget(self.codec_combo)
+        _add_labeled(tab1_layout, "Codec", self.codec_combo)
 
         self.hw_vaapi_checkbox = QCheckBox("Use hardware acceleration (VA-API)")
         self.hw_vaapi_checkbox.setChecked(False)
@@ -162,21 +210,22 @@ class UserInterface(QMainWindow):
         self.progress_bar = QProgressBar()
         tab1_layout.addWidget(self.progress_bar)
 
+        # Progress updates are applied at most every 33 ms, the latest one wins
+        self._pending_progress: float | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)  # pylint: disable=no-member
+
         self.status_label = QLabel("Status: Idle")
         tab1_layout.addWidget(self.status_label)
 
-        self.spinner_label = QLabel()
-        self.spinner_label.setFixedSize(24, 24)
-        self.spinner_label.hide()
-
-        # Load spinner GIF (you need a small loading.gif file)
-        self.spinner_movie = QMovie("loading.gif")
-        self.spinner_movie.setScaledSize(QSize(24, 24))
-        self.spinner_label.setMovie(self.spinner_movie)
+        self.spinner = Spinner(24)
+        self.spinner.hide()
 
         # Add spinner next to status label
         status_layout = QHBoxLayout()
-        status_layout.addWidget(self.spinner_label)
+        status_layout.addWidget(self.spinner)
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
 
@@ -211,12 +260,22 @@ class UserInterface(QMainWindow):
 
         tab3_layout.addWidget(QLabel("Tab 3 – Logs / Output"))
 
-        self.log_edit = QTextEdit()
+        self.log_edit = QPlainTextEdit()
         self.log_edit.setReadOnly(True)
+        self.log_edit.setUndoRedoEnabled(False)
+        # Drop the oldest lines so long conversions don't grow the document without bound
+        self.log_edit.setMaximumBlockCount(5000)
         tab3_layout.addWidget(self.log_edit)
 
+        # Lines are collected and written to the log every 50 ms, in one block
+        self._log_buffer: deque[str] = deque(maxlen=5000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)  # pylint: disable=no-member
+
         clear_log_button = QPushButton("Clear Log")
-        clear_log_button.clicked.connect(self.log_edit.clear)  # pylint: disable=no-member
+        clear_log_button.clicked.connect(self.clear_log)  # pylint: disable=no-member
         tab3_layout.addWidget(clear_log_button)
 
         # Add tabs
@@ -246,10 +305,8 @@ class UserInterface(QMainWindow):
         Args:
             event (QDropEvent): The drop event.
         """
-        for url in event.mimeData().urls():
-            path = Path(url.toLocalFile())
-            if path.exists():
-                self.add_files([path])
+        # One add for the whole drop, remote URLs would turn into Path("") and scan the working directory
+        self.add_files([Path(url.toLocalFile()) for url in event.mimeData().urls() if url.isLocalFile()])
 
     # --------------------------------------------------
     # File Handling
@@ -260,7 +317,7 @@ class UserInterface(QMainWindow):
             self,
             "Select Files",
             str(Path.home()),
-            "Video Files (*.mp4 *.mkv *.avi *.mov *.webm *.ts)",
+            f"Video Files ({' '.join(f'*{suffix}' for suffix in _VIDEO_SUFFIXES)})",
         )
         self.add_files([Path(f) for f in files])
 
@@ -275,31 +332,28 @@ class UserInterface(QMainWindow):
             self.output_edit.setText(folder)
 
     def add_files(self, paths: list[Path]) -> None:
-        """Add files to the UI.
+        """Add files to the UI, folders are searched for video files recursively.
 
         Args:
             paths (list[Path]): List of paths to add.
         """
-        for path in paths:
-            if path.is_file() and path not in self.added_files:
-                self.added_files.append(path)
-
-        self.refresh_file_list()
-
-    def refresh_file_list(self) -> None:
-        """Refresh the file list in the UI."""
-        self.file_table.setRowCount(len(self.added_files))
+        # Re-adding files that are already listed is a no-op, don't even start a scan for it
+        paths = [path for path in paths if path not in self.file_model]
+        if not paths:
+            return
+        # Stat and walk in the thread pool, a slow drive must not freeze the window
+        scanner = FileScanner(paths)
+        scanner.signals.finished.connect(self.add_scanned_files, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(scanner)
 
-        for row, path in enumerate(self.added_files):
-            self.file_table.setItem(row, 0, QTableWidgetItem(path.name))
-            size_mb = path.stat().st_size / (1024 * 1024)
-            self.file_table.setItem(row, 1, QTableWidgetItem(f"{size_mb:.1f} MB"))
+    @Slot(object)  # type: ignore[arg-type]
+    def add_scanned_files(self, files: dict[Path, tuple[int, int]]) -> None:
+        """Add the files found by a FileScanner to the list.
 
-            remove_button = QPushButton("X")
-            remove_button.clicked.connect(  # pylint: disable=no-member
-                lambda _, p=path: self.remove_file(p),
-            )
-            self.file_table.setCellWidget(row, 2, remove_button)
+        Args:
+            files (dict[Path, tuple[int, int]]): Size and modification time of the files found.
+        """
+        self.file_model.add_files({path: info for path, info in files.items() if path not in self.file_model})
 
     def remove_file(self, path: Path) -> None:
         """Remove file from list
@@ -307,14 +361,12 @@ class UserInterface(QMainWindow):
         Args:
             path (Path): Path to file
         """
-        if path in self.added_files:
-            self.added_files.remove(path)
-            self.refresh_file_list()
+        if path in self.file_model:
+            self.file_model.remove_row(self.added_files.index(path))
 
     def clear_list(self) -> None:
         """Clean file list"""
-        self.added_files.clear()
-        self.refresh_file_list()
+        self.file_model.clear()
 
     # --------------------------------------------------
     # Misc
@@ -323,7 +375,7 @@ class UserInterface(QMainWindow):
         """Open a color dialog and log the selected color."""
         color = QColorDialog.getColor()
         if color.isValid():
-            self.log_edit.append(f"Selected color: {color.name()}")
+            self.append_log(f"Selected color: {color.name()}")
 
     def start_conversion(self) -> None:
         """Starts the conversion process."""
@@ -363,23 +415,62 @@ class UserInterface(QMainWindow):
         """Fetches the available codecs from the backend."""
         self.backend.run_get_codecs()
 
-    def update_codec_list(self, codecs: list[dict]) -> None:
+    @Slot(object)  # type: ignore[arg-type]
+    def update_codec_list(self, codecs: list[CodecInfo]) -> None:
+        """Fill the codec list with the encoders reported by ffmpeg.
 
-        self.codec_combo.clear()
+        Args:
+            codecs (list[CodecInfo]): Available encoders.
+        """
         self.codec_list.clear()
+        self._vaapi_codecs.clear()
+        self._vulkan_codecs.clear()
         for codec in codecs:
-            description = codec["description"] if len(codec["description"]) < 50 else f"{codec['description'][:50]}..."
-            codec_list_entry = f"{codec['codec']} - {description}"
-            self.codec_list.append({"text":codec_list_entry, "codec_name":codec["codec"]})
-            self.codec_combo.addItem(codec_list_entry, codec["codec"])
+            description = codec.description if len(codec.description) < 50 else f"{codec.description[:50]}..."
+            entry = (f"{codec.codec} - {description}", codec.codec)
+            self.codec_list.append(entry)
+            name = codec.codec.lower()
+            if "_vaapi" in name:
+                self._vaapi_codecs.append(entry)
+            if "_vulkan" in name:
+                self._vulkan_codecs.append(entry)
+        self._fill_codec_combo(self.codec_list)
+
+    def _fill_codec_combo(self, entries: list[tuple[str, str]]) -> None:
+        """Replace the entries of the codec combo box.
 
+        Args:
+            entries (list[tuple[str, str]]): Text and codec name of each entry.
+        """
+        # addItems() can't carry the codec name as item data, so add them one by one without repainting
+        # and without a current index change signal per item
+        self.codec_combo.setUpdatesEnabled(False)
+        with QSignalBlocker(self.codec_combo):
+            self.codec_combo.clear()
+            for text, codec_name in entries:
+                self.codec_combo.addItem(text, codec_name)
+        self.codec_combo.setUpdatesEnabled(True)
+
+    @Slot(float)
     def update_progress(self, value: float) -> None:
         """Update progress bar with a value between 0 and 1.
 
         Args:
             value (float): Value between 0 and 1.
         """
-        self.progress_bar.setRange(0, 100)
+        self._pending_progress = value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        """Show the latest progress on the progress bar."""
+        value = self._pending_progress
+        if value is None:
+            return
+        self._pending_progress = None
+        # Leave the busy indicator once, on the first real value
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(int(value * 100))
 
     def append_log(self, line: str) -> None:
@@ -388,8 +479,33 @@ class UserInterface(QMainWindow):
         Args:
            line (str): Line to append.
         """
-        self.log_edit.append(line)
+        self._log_buffer.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @Slot(list)
+    def append_log_batch(self, lines: list[str]) -> None:
+        """Append a batch of lines to the log edit widget.
 
+        Args:
+           lines (list[str]): Lines to append.
+        """
+        self._log_buffer.extend(lines)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Write the collected lines to the log edit widget."""
+        if self._log_buffer:
+            self.log_edit.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def clear_log(self) -> None:
+        """Clear the log, including lines not shown yet."""
+        self._log_buffer.clear()
+        self.log_edit.clear()
+
+    @Slot(int)
     def command_finished(self, exit_code: int) -> None:
         """Handle command finished signal.
 
@@ -397,10 +513,13 @@ class UserInterface(QMainWindow):
             exit_code (int): Exit code of the command.
         """
         self.stop_spinner()
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(100)
         self.status_label.setText(f"Finished (exit code {exit_code})")
 
+    @Slot(str)
     def show_error(self, message: str) -> None:
         """Show error message in UI.
 
@@ -408,7 +527,7 @@ class UserInterface(QMainWindow):
             message (str): Error message to display.
         """
         self.status_label.setText("Error occurred")
-        self.log_edit.append(f"ERROR: {message}")
+        self.append_log(f"ERROR: {message}")
         self.stop_spinner()
 
     def start_spinner(self) -> None:
@@ -420,29 +539,354 @@ class UserInterface(QMainWindow):
         self.loading_overlay.stop()
 
     def apply_filter_vaapi(self) -> None:
-        self.codec_combo.clear()
+        """Show only the VA-API encoders while VA-API is enabled."""
+        self._fill_codec_combo(self._vaapi_codecs if self.hw_vaapi_checkbox.isChecked() else self.codec_list)
 
-        if self.hw_vaapi_checkbox.isChecked():
-            # Contains "vaapi" (case insensitive)
-            for list_item in self.codec_list:
-                if "_vaapi" in list_item["codec_name"].lower():
-                    self.codec_combo.addItem(list_item["text"], list_item["codec_name"])
-        else:
-            # Show everything
-            for list_item in self.codec_list:
-                self.codec_combo.addItem(list_item["text"], list_item["codec_name"])
-
-    def apply_filter_vulkan(self):
-        self.codec_combo.clear()
-
-        if self.hw_vulkan_checkbox.isChecked():
-            # Contains "vaapi" (case insensitive)
-            for codec in self.codec_list:
-                if "_vulkan" in codec.split()[0].lower():
-                    self.codec_combo.addItem(codec)
-        else:
-            # Show everything
-            self.codec_combo.addItems(self.codec_list)
+    def apply_filter_vulkan(self) -> None:
+        """Show only the Vulkan encoders while Vulkan is enabled."""
+        self._fill_codec_combo(self._vulkan_codecs if self.hw_vulkan_checkbox.isChecked() else self.codec_list)
+
+
+class FileScannerSignals(QObject):
+    """Signals of a FileScanner, QRunnable is not a QObject."""
+
+    finished = Signal(object)  # dict[Path, tuple[int, int]]
+
+
+class FileScanner(QRunnable):
+    """Find the files to add for a list of dropped or picked paths in the thread pool."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        """Set up the scanner.
+
+        Args:
+            paths (list[Path]): Files and folders to scan, folders are searched for video files recursively.
+        """
+        super().__init__()
+        self.paths = paths
+        self.signals = FileScannerSignals()
+
+    def run(self) -> None:
+        """Executed inside the thread pool, emits the size and modification time of every file found."""
+        files: dict[Path, tuple[int, int]] = {}
+        for path in self.paths:
+            if path in files:
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                files[path] = (st.st_size, st.st_mtime_ns)
+            elif stat.S_ISDIR(st.st_mode):
+                self._scan_folder(path, files)
+        self.signals.finished.emit(files)
+
+    @staticmethod
+    def _scan_folder(folder: Path, files: dict[Path, tuple[int, int]]) -> None:
+        """Collect the video files below a folder.
+
+        Args:
+            folder (Path): Folder to search.
+            files (dict[Path, tuple[int, int]]): Size and modification time of the files found so far.
+        """
+        # scandir() gets the file types from the directory listing, only the files we keep are stat()ed
+        folders = [str(folder)]
+        while folders:
+            for entry in FileScanner._list_folder(folders.pop()):
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+                # Check the name first, no Path is built for the files that are skipped anyway
+                elif entry.name.lower().endswith(_VIDEO_SUFFIXES) and entry.is_file():
+                    path = Path(entry.path)
+                    if path not in files and (info := FileScanner._file_info(entry)) is not None:
+                        files[path] = info
+
+    @staticmethod
+    def _list_folder(folder: str) -> list[os.DirEntry[str]]:
+        """List a folder, an unreadable folder is treated as empty.
+
+        Args:
+            folder (str): Folder to list.
+
+        Returns:
+            list[os.DirEntry[str]]: The entries of the folder.
+        """
+        try:
+            with os.scandir(folder) as entries:
+                return list(entries)
+        except OSError:
+            return []
+
+    @staticmethod
+    def _file_info(entry: os.DirEntry[str]) -> tuple[int, int] | None:
+        """Get the size and modification time of a file.
+
+        Args:
+            entry (os.DirEntry[str]): Directory entry of the file.
+
+        Returns:
+            tuple[int, int] | None: Size and modification time, None if the file vanished in the meantime.
+        """
+        try:
+            st = entry.stat()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+
+class FileListModel(QAbstractTableModel):
+    """Table model for the input files.
+
+    Only the rows the view actually shows are queried, so the list can hold thousands of files.
+    """
+
+    HEADERS = ("Filename", "Size", "")
+    REMOVE_COLUMN = 2
+
+    def __init__(self, parent: Any = None) -> None:
+        """Set up an empty model.
+
+        Args:
+            parent (Any): Parent object.
+        """
+        super().__init__(parent)
+        self.files: list[Path] = []
+        # (size, formatted size, mtime_ns) taken when a file is added, so painting a row is a plain lookup
+        # It has an entry for every file and doubles as the index for membership tests
+        self._stat_cache: dict[Path, tuple[int, str, int]] = {}
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._stat_cache
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: B008
+        """Return the number of files.
+
+        Args:
+            parent (QModelIndex | QPersistentModelIndex): Parent index, only the invalid root has rows.
+        """
+        return 0 if parent.isValid() else len(self.files)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: B008
+        """Return the number of columns.
+
+        Args:
+            parent (QModelIndex | QPersistentModelIndex): Parent index, only the invalid root has columns.
+        """
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the file name or size for a cell.
+
+        Args:
+            index (QModelIndex | QPersistentModelIndex): Cell to return the data for.
+            role (int): Requested data role.
+        """
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        path = self.files[index.row()]
+        if index.column() == 0:
+            return path.name
+        if index.column() == 1:
+            return self._stat_cache[path][1]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the column labels.
+
+        Args:
+            section (int): Column or row number.
+            orientation (Qt.Orientation): Header orientation.
+            role (int): Requested data role.
+        """
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def add_files(self, files: dict[Path, tuple[int, int]]) -> None:
+        """Append files to the end of the list.
+
+        Args:
+            files (dict[Path, tuple[int, int]]): Size and modification time of the files to append,
+                already checked for duplicates.
+        """
+        if not files:
+            return
+        start = len(self.files)
+        self.beginInsertRows(QModelIndex(), start, start + len(files) - 1)
+        self.files.extend(files)
+        for path, (size, mtime_ns) in files.items():
+            self._stat_cache[path] = (size, self._format_size(size), mtime_ns)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        """Remove a single file.
+
+        Args:
+            row (int): Row of the file to remove.
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._stat_cache.pop(self.files.pop(row), None)
+        self.endRemoveRows()
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        """Format a file size for the size column.
+
+        Args:
+            size (int): Size in bytes.
+        """
+        # Tenths of a MiB, rounded half up, in integer math
+        tenths = (size * 10 + (1 << 19)) >> 20
+        # Many files share a size string, keep one copy of each
+        return sys.intern(f"{tenths // 10}.{tenths % 10} MB")
+
+    def clear(self) -> None:
+        """Remove all files."""
+        self.beginResetModel()
+        self.files.clear()
+        self._stat_cache.clear()
+        self.endResetModel()
+
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """Paints an "X" button in the remove column and removes the row when it is clicked.
+
+    The button is only drawn, there is no widget per row.
+    """
+
+    def __init__(self, parent: Any = None) -> None:
+        """Set up the shared button style option.
+
+        Args:
+            parent (Any): Parent object.
+        """
+        super().__init__(parent)
+        # One style option shared by all rows, only its rect changes
+        self._button = QStyleOptionButton()
+        self._button.text = "X"
+        self._button.state = QStyle.StateFlag.State_Enabled
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        """Paint the button.
+
+        Args:
+            painter (QPainter): Painter of the view.
+            option (QStyleOptionViewItem): Style options of the cell.
+            index (QModelIndex | QPersistentModelIndex): Cell to paint.
+        """
+        super().paint(painter, option, index)
+        self._button.rect = option.rect.adjusted(2, 2, -2, -2)
+        widget = option.widget  # type: ignore[attr-defined]
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, self._button, painter, widget)
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> bool:
+        """Remove the row on a left click.
+
+        Args:
+            event (QEvent): Event on the cell.
+            model (QAbstractItemModel): Model of the view.
+            option (QStyleOptionViewItem): Style options of the cell.
+            index (QModelIndex | QPersistentModelIndex): Cell the event happened on.
+        """
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and isinstance(event, QMouseEvent)
+            and event.button() == Qt.MouseButton.LeftButton
+            and isinstance(model, FileListModel)
+        ):
+            model.remove_row(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class Spinner(QWidget):
+    """Busy indicator painted as a rotating arc.
+
+    All running spinners are driven by one shared timer.
+    """
+
+    INTERVAL = 60  # ms
+    STEP = 30  # degrees per tick
+
+    _timer: ClassVar[QTimer | None] = None
+    # Running spinners by key, a spinner deleted by its parent while running drops out through destroyed
+    _running: ClassVar[dict[int, "Spinner"]] = {}
+    _keys: ClassVar[Iterator[int]] = itertools.count()
+    _angle: ClassVar[int] = 0
+
+    def __init__(self, size: int, parent: Any = None) -> None:
+        """Set up a stopped spinner.
+
+        Args:
+            size (int): Width and height in pixels.
+            parent (Any): Parent widget.
+        """
+        super().__init__(parent)
+        self.setFixedSize(size, size)
+        self._key = next(Spinner._keys)
+        # Only the key is bound, the connection must not keep the spinner alive
+        self.destroyed.connect(partial(Spinner._forget, self._key))  # pylint: disable=no-member
+
+    def start(self) -> None:
+        """Start the animation."""
+        if self._key in Spinner._running:
+            return
+        Spinner._running[self._key] = self
+        if Spinner._timer is None:
+            Spinner._timer = QTimer()
+            Spinner._timer.setInterval(self.INTERVAL)
+            Spinner._timer.timeout.connect(Spinner._advance)  # pylint: disable=no-member
+        Spinner._timer.start()
+
+    def stop(self) -> None:
+        """Stop the animation."""
+        Spinner._forget(self._key)
+
+    @staticmethod
+    def _forget(key: int) -> None:
+        """Remove a spinner from the running ones, the timer stops with the last one.
+
+        Args:
+            key (int): Key of the spinner.
+        """
+        if Spinner._running.pop(key, None) is not None and not Spinner._running and Spinner._timer is not None:
+            Spinner._timer.stop()
+
+    @staticmethod
+    def _advance() -> None:
+        Spinner._angle = (Spinner._angle + Spinner.STEP) % 360
+        for spinner in Spinner._running.values():
+            spinner.update()
+
+    def paintEvent(self, _event: QPaintEvent) -> None:
+        """Paint the arc at the current angle.
+
+        Args:
+            _event (QPaintEvent): The paint event.
+        """
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        width = max(2, self.width() // 8)
+        pen = QPen(self.palette().color(QPalette.ColorRole.Highlight), width)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        rect = self.rect().adjusted(width, width, -width, -width)
+        # Angles are in 1/16th of a degree, counterclockwise
+        painter.drawArc(rect, -Spinner._angle * 16, 270 * 16)
+        painter.end()
 
 
 class LoadingOverlay(QWidget):
@@ -454,29 +898,28 @@ class LoadingOverlay(QWidget):
         super().__init__(parent)
 
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 120);
-        """)
+        self.setStyleSheet(_OVERLAY_QSS)
 
         self.setVisible(False)
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.spinner_label = QLabel()
-        self.spinner_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.spinner = Spinner(64)
 
         self.text_label = QLabel("Working...")
-        self.text_label.setStyleSheet("color: white; font-size: 16px;")
+        self.text_label.setStyleSheet(_OVERLAY_TEXT_QSS)
         self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.movie = QMovie("loading.gif")
-        self.movie.setScaledSize(QSize(64, 64))
-        self.spinner_label.setMovie(self.movie)
-
-        layout.addWidget(self.spinner_label)
+        layout.addWidget(self.spinner, alignment=Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(self.text_label)
 
+        # Follow the parent's size while visible, a drag produces a burst of resize events that is applied once
+        self._resize_pending = False
+        self._last_rect: QRect | None = None
+        if parent is not None:
+            parent.installEventFilter(self)
+
     def start(self, text: str = "Working...") -> None:
         """Start loading animation
 
@@ -484,20 +927,38 @@ class LoadingOverlay(QWidget):
             text (str): Text to show under the animation
         """
         self.text_label.setText(text)
-        self.setGeometry(self.parent().rect())  # type: ignore[attr-defined]
-        self.show()
-        self.movie.start()
+        self._fit_parent()
+        if self.isHidden():
+            self.show()
+            self.spinner.start()
 
     def stop(self) -> None:
         """Stop loading animation"""
-        self.movie.stop()
-        self.hide()
+        if not self.isHidden():
+            self.spinner.stop()
+            self.hide()
 
-    def resizeEvent(self, event: QResizeEvent) -> None:
-        """Resize the widget to fit its parent.
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Schedule a resize when the parent was resized.
 
         Args:
-            event (QResizeEvent): The resize event.
+            watched (QObject): Object the event was sent to.
+            event (QEvent): The event.
         """
-        self.setGeometry(self.parent().rect())  # type: ignore[attr-defined]
-        super().resizeEvent(event)
+        if (
+            watched is self.parent()
+            and event.type() == QEvent.Type.Resize
+            and not self.isHidden()
+            and not self._resize_pending
+        ):
+            self._resize_pending = True
+            QTimer.singleShot(0, self._fit_parent)
+        return super().eventFilter(watched, event)
+
+    def _fit_parent(self) -> None:
+        """Resize the widget to fit its parent, if the parent changed since the last time."""
+        self._resize_pending = False
+        rect = self.parent().rect()  # type: ignore[attr-defined]
+        if rect != self._last_rect:
+            self._last_rect = rect
+            self.setGeometry(rect)
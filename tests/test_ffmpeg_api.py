@@ -0,0 +1,356 @@
+"""Tests for the ffmpeg/ffprobe backend."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections import deque
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ffmpeg_py_gui._internal import ffmpeg_api
+from ffmpeg_py_gui._internal.ffmpeg_api import CodecInfo, FFmpegBackend, FFmpegWorker
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(name="backend")
+def _fixture_backend() -> FFmpegBackend:
+    return FFmpegBackend(ui=None)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("  Duration: 00:01:30.50, start: 0.000000, bitrate: 1205 kb/s", 90.5),
+        ("  Duration: 01:00:00.00, start: 0.000000", 3600.0),
+        ("  Duration: N/A, start: 0.000000", None),
+        ("Stream #0:0: Video: h264", None),
+    ],
+)
+def test_parse_duration(backend: FFmpegBackend, line: str, expected: float | None) -> None:
+    """Parse the input duration from ffmpeg's log header.
+
+    Parameters:
+        backend: The backend under test.
+        line: A line of ffmpeg output.
+        expected: The expected duration in seconds.
+    """
+    assert backend._parse_duration(line) == expected
+
+
+def test_parse_encoders(backend: FFmpegBackend) -> None:
+    """Parse the encoder table, skipping the legend above the separator.
+
+    Parameters:
+        backend: The backend under test.
+    """
+    lines = [
+        "Encoders:",
+        " V..... = Video",
+        " ------",
+        " V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC (codec h264)",
+        " V....D h264_vaapi           H.264/AVC (VAAPI) (codec h264)",
+        " A....D aac                  AAC (Advanced Audio Coding)",
+        " S.....",
+    ]
+    assert backend._parse_encoders(lines) == [
+        CodecInfo("libx264", "V....D", "libx264 H.264 / AVC / MPEG-4 AVC (codec h264)"),
+        CodecInfo("h264_vaapi", "V....D", "H.264/AVC (VAAPI) (codec h264)"),
+        CodecInfo("aac", "A....D", "AAC (Advanced Audio Coding)"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("12.500000", 12.5),
+        ("N/A", None),
+    ],
+)
+def test_probe_duration(
+    backend: FFmpegBackend,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    output: str,
+    expected: float | None,
+) -> None:
+    """Read the duration printed by ffprobe.
+
+    Parameters:
+        backend: The backend under test.
+        tmp_path: Pytest fixture for a temporary directory.
+        monkeypatch: Pytest fixture to patch the environment.
+        output: What the fake ffprobe prints.
+        expected: The expected duration in seconds.
+    """
+    ffprobe = tmp_path / "ffprobe"
+    ffprobe.write_text(f"#!/bin/sh\necho {output}\n", encoding="utf-8")
+    ffprobe.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert backend._probe_duration("input.mp4") == expected
+
+
+def test_probe_duration_without_ffprobe(
+    backend: FFmpegBackend,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A missing ffprobe means an unknown duration, not an error.
+
+    Parameters:
+        backend: The backend under test.
+        tmp_path: Pytest fixture for a temporary directory.
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert backend._probe_duration("input.mp4") is None
+
+
+def test_worker_batches_output_lines() -> None:
+    """The worker sends its output to the UI in batches, not line by line."""
+    script = "import sys\nfor i in range(200): print(f'line {i}')\nsys.exit(3)"
+    worker = FFmpegWorker([sys.executable, "-c", script])
+    batches: list[list[str]] = []
+    exit_codes: list[int] = []
+    worker.output_lines.connect(batches.append)
+    worker.finished.connect(exit_codes.append)
+
+    worker.run()
+
+    assert exit_codes == [3]
+    assert 0 < len(batches) < 200
+    assert [line for batch in batches for line in batch] == [f"line {i}" for i in range(200)]
+
+
+def test_worker_throttles_progress() -> None:
+    """Progress changes below half a percent are not emitted."""
+    worker = FFmpegWorker([])
+    values: list[float] = []
+    worker.progress.connect(values.append)
+
+    for value in (0.001, 0.004, 0.006, 0.5, 0.501, 1.0, 1.0):
+        worker.report_progress(value)
+        worker._flush_progress()  # pylint: disable=protected-access
+
+    assert values == [0.006, 0.5, 1.0]
+
+
+def test_worker_coalesces_progress() -> None:
+    """Only the latest progress reported between two flushes is emitted."""
+    script = "\n".join(f"print('out_time_us={i}')" for i in range(1, 101))
+    worker = FFmpegWorker(
+        [sys.executable, "-c", script],
+        line_parser=lambda line: worker.report_progress(int(line.partition("=")[2]) / 100) or True,
+    )
+    values: list[float] = []
+    worker.progress.connect(values.append)
+
+    worker.run()
+
+    assert values[-1] == 1.0
+    assert len(values) < 100
+
+
+def test_worker_splits_carriage_returns() -> None:
+    """Status lines ended by a bare carriage return are reported one by one."""
+    script = "import sys\nsys.stdout.write('head\\r\\nframe=1\\rframe=2\\rframe=3\\nlast')"
+    worker = FFmpegWorker([sys.executable, "-c", script])
+    lines: list[str] = []
+    worker.output_lines.connect(lines.extend)
+
+    worker.run()
+
+    assert lines == ["head", "frame=1", "frame=2", "frame=3", "last"]
+
+
+def test_worker_hides_consumed_lines() -> None:
+    """Lines consumed by the line parser are not logged."""
+    script = "print('out_time_us=1000000')\nprint('Output #0, mp4')\nprint('progress=end')"
+    worker = FFmpegWorker([sys.executable, "-c", script], line_parser=lambda line: "=" in line)
+    lines: list[str] = []
+    worker.output_lines.connect(lines.extend)
+
+    worker.run()
+
+    assert lines == ["Output #0, mp4"]
+
+
+def test_worker_binary_capture() -> None:
+    """In binary capture mode the final parser gets the raw output and nothing is logged."""
+    script = "import sys\nsys.stdout.write('{\"streams\": []}\\n')"
+    results: list[object] = []
+    lines: list[str] = []
+    worker = FFmpegWorker(
+        [sys.executable, "-c", script],
+        final_parser=lambda stdout, exit_code: (stdout, exit_code),
+        binary_capture=True,
+    )
+    worker.result.connect(results.append)
+    worker.output_lines.connect(lines.extend)
+
+    worker.run()
+
+    assert results == [(b'{"streams": []}\n', 0)]
+    assert not lines
+
+
+def test_worker_stops_quiet_process() -> None:
+    """A stopped worker kills its process even if the process prints nothing."""
+    worker = FFmpegWorker([sys.executable, "-c", "import time; time.sleep(30)"])
+    exit_codes: list[int] = []
+    worker.finished.connect(exit_codes.append)
+
+    worker.stop()
+    worker.run()
+
+    assert exit_codes
+    assert exit_codes[0] != 0
+
+
+def test_split_lines_keeps_incomplete_tail() -> None:
+    """Only complete lines are queued, the rest stays in the buffer for the next read."""
+    lines: deque[str] = deque()
+    data = bytearray(b"first\r\nsecond\rthi")
+    FFmpegWorker._split_lines(data, lines)
+    assert data == b"thi"
+    data += b"rd\r"
+    FFmpegWorker._split_lines(data, lines)
+    assert data == b""
+    data += "\nfourth\nf\u00fc".encode()
+    FFmpegWorker._split_lines(data, lines)
+    assert data == "f\u00fc".encode()
+    assert list(lines) == ["first", "second", "third", "fourth"]
+
+
+def test_split_lines_only_at_line_breaks() -> None:
+    """Control characters other than line breaks stay inside the line."""
+    lines: deque[str] = deque()
+    data = bytearray(b"title=a\x0cb  c\x1dd\n\xffx\r\n")
+    FFmpegWorker._split_lines(data, lines)
+    assert list(lines) == ["title=a\x0cb  c\x1dd", "\ufffdx"]
+
+
+def test_worker_prepares_before_start() -> None:
+    """The prepare callback runs before the command, in the same thread."""
+    calls: list[str] = []
+    worker = FFmpegWorker(
+        [sys.executable, "-c", "print('started')"],
+        line_parser=calls.append,
+        prepare=lambda: calls.append("prepared"),
+    )
+
+    worker.run()
+
+    assert calls == ["prepared", "started"]
+
+
+def test_workers_reuse_read_buffers(backend: FFmpegBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Consecutive jobs of a backend read with the same buffers.
+
+    Parameters:
+        backend: The backend under test.
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    backend.ui = SimpleNamespace(update_codec_list=lambda codecs: None)
+    workers: list[FFmpegWorker] = []
+    monkeypatch.setattr(backend, "_start_worker", workers.append)
+    backend.run_get_codecs()
+    backend.run_conversion("input.mp4", "output.mp4")
+    pool = backend._read_buffers
+
+    for worker in workers:
+        assert worker._buffer_pool is pool
+        worker.command = [sys.executable, "-c", "print('line')"]
+        worker.prepare = None
+        worker.run()
+        assert len(pool) == 1
+    first = pool[0]
+
+    worker = FFmpegWorker([sys.executable, "-c", "print('line')"], buffer_pool=pool)
+    worker.run()
+    assert list(pool) == [first]
+    assert not first.accumulator
+    assert not first.pending
+
+
+def test_conversion_keeps_log_lines_shaped_like_progress(
+    backend: FFmpegBackend,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only the keys of the -progress block are consumed, other key=value lines are logged.
+
+    Parameters:
+        backend: The backend under test.
+        tmp_path: Pytest fixture for a temporary directory.
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    output = [
+        "  Duration: 00:00:10.00, start: 0.000000, bitrate: 1205 kb/s",
+        "key=value style line from a filter",
+        "frame=25",
+        "stream_0_0_q=28.0",
+        "out_time_us=5000000",
+        "progress=continue",
+        "out_time_us=10000000",
+        "progress=end",
+    ]
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text("#!/bin/sh\n" + "".join(f"echo '{line}'\n" for line in output), encoding="utf-8")
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    workers: list[FFmpegWorker] = []
+    monkeypatch.setattr(backend, "_start_worker", workers.append)
+
+    backend.run_conversion("input.mp4", "output.mp4")
+    worker = workers[0]
+    lines: list[str] = []
+    values: list[float] = []
+    worker.output_lines.connect(lines.extend)
+    worker.progress.connect(values.append)
+    worker.run()
+
+    assert lines == output[:2]
+    assert values[-1] == 1.0
+
+
+@pytest.mark.parametrize("decoder", ["json", "orjson"])
+@pytest.mark.parametrize(
+    ("stdout", "expected"),
+    [
+        (b'{"streams": [], "format": {"duration": "1.5"}}\n', {"streams": [], "format": {"duration": "1.5"}}),
+        (b"not json", None),
+    ],
+)
+def test_file_info_parser(
+    backend: FFmpegBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    decoder: str,
+    stdout: bytes,
+    expected: dict[str, object] | None,
+) -> None:
+    """The ffprobe JSON is decoded with either JSON library, broken output gives no result.
+
+    Parameters:
+        backend: The backend under test.
+        monkeypatch: Pytest fixture to patch the environment.
+        decoder: Name of the JSON library to decode with.
+        stdout: What ffprobe prints.
+        expected: The expected result.
+    """
+    loads = pytest.importorskip(decoder).loads if decoder == "orjson" else json.loads
+    monkeypatch.setattr(ffmpeg_api, "_json_loads", loads)
+    workers: list[FFmpegWorker] = []
+    monkeypatch.setattr(backend, "_start_worker", workers.append)
+    backend.ui = SimpleNamespace(display_file_info=lambda info: None)
+
+    backend.run_get_file_info("input.mp4")
+    final_parser = workers[0].final_parser
+    assert final_parser is not None
+
+    assert final_parser(stdout, 0) == expected
+    assert final_parser(stdout, 1) is None
@@ -0,0 +1,199 @@
+"""Tests for the user interface models."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent, Qt
+from PySide6.QtWidgets import QApplication, QWidget
+
+from ffmpeg_py_gui._internal.ffmpeg_api import CodecInfo
+from ffmpeg_py_gui.gui.user_interface import FileListModel, FileScanner, Spinner, UserInterface
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(name="window")
+def fixture_window() -> Iterator[UserInterface]:
+    """Provide a main window.
+
+    Yields:
+        A main window, not shown.
+    """
+    app = QApplication.instance() or QApplication([])
+    ui = UserInterface()
+    yield ui
+    ui.deleteLater()
+    app.processEvents()
+
+
+def test_file_list_model(tmp_path: Path) -> None:
+    """Files can be added, shown and removed.
+
+    Parameters:
+        tmp_path: A temporary path.
+    """
+    files = {tmp_path / "a.mp4": (0, 0), tmp_path / "b.mkv": (3 * 1024 * 1024, 0)}
+    model = FileListModel()
+    inserted: list[tuple[int, int]] = []
+    model.rowsInserted.connect(lambda _, first, last: inserted.append((first, last)))
+
+    model.add_files(files)
+    model.add_files({})
+
+    assert inserted == [(0, 1)]
+    assert model.rowCount() == 2
+    assert model.columnCount() == 3
+    assert model.data(model.index(1, 0)) == "b.mkv"
+    assert model.data(model.index(1, 1)) == "3.0 MB"
+    assert model.headerData(0, Qt.Orientation.Horizontal) == "Filename"
+    assert tmp_path / "a.mp4" in model
+
+    model.remove_row(0)
+    assert model.files == [tmp_path / "b.mkv"]
+    assert tmp_path / "a.mp4" not in model
+
+    model.clear()
+    assert model.rowCount() == 0
+
+
+def test_file_scanner(tmp_path: Path) -> None:
+    """Files are added as given, folders only contribute their video files.
+
+    Parameters:
+        tmp_path: A temporary path.
+    """
+    for name in ("notes.txt", "a.mp4", "sub/b.MKV", "sub/c.srt"):
+        path = tmp_path / "folder" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"data")
+    single = tmp_path / "single.txt"
+    single.write_bytes(b"")
+    scanner = FileScanner([single, tmp_path / "folder", tmp_path / "missing.mp4", single])
+    results: list[dict[Path, tuple[int, int]]] = []
+    scanner.signals.finished.connect(results.append)
+
+    scanner.run()
+
+    assert len(results) == 1
+    assert sorted(results[0]) == [tmp_path / "folder" / "a.mp4", tmp_path / "folder" / "sub" / "b.MKV", single]
+    assert results[0][single][0] == 0
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        (0, "0.0 MB"),
+        (52_428, "0.0 MB"),
+        (52_429, "0.1 MB"),
+        (3 * 1024 * 1024, "3.0 MB"),
+        (1536 * 1024 * 1024, "1536.0 MB"),
+    ],
+)
+def test_format_size(size: int, expected: str) -> None:
+    """Sizes are shown in MiB with one decimal.
+
+    Parameters:
+        size: Size in bytes.
+        expected: Expected text.
+    """
+    assert FileListModel._format_size(size) == expected
+
+
+def test_codec_filters(window: UserInterface) -> None:
+    """The hardware checkboxes limit the codec combo to the matching encoders.
+
+    Parameters:
+        window: A main window.
+    """
+    window.update_codec_list(
+        [
+            CodecInfo("libx264", "V....D", "libx264 H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10"),
+            CodecInfo("h264_vaapi", "V....D", "H.264/AVC (VAAPI)"),
+            CodecInfo("av1_vulkan", "V....D", "AV1 (Vulkan)"),
+        ],
+    )
+
+    def codecs() -> list[str]:
+        return [window.codec_combo.itemData(i) for i in range(window.codec_combo.count())]
+
+    assert codecs() == ["libx264", "h264_vaapi", "av1_vulkan"]
+    assert window.codec_combo.itemText(1) == "h264_vaapi - H.264/AVC (VAAPI)"
+
+    window.hw_vaapi_checkbox.setChecked(True)
+    assert codecs() == ["h264_vaapi"]
+    window.hw_vaapi_checkbox.setChecked(False)
+    assert codecs() == ["libx264", "h264_vaapi", "av1_vulkan"]
+
+    window.hw_vulkan_checkbox.setChecked(True)
+    assert codecs() == ["av1_vulkan"]
+    window.hw_vulkan_checkbox.setChecked(False)
+    assert codecs() == ["libx264", "h264_vaapi", "av1_vulkan"]
+
+
+def test_progress_is_throttled(window: UserInterface) -> None:
+    """Only the latest progress value is shown when the timer fires.
+
+    Parameters:
+        window: A main window.
+    """
+    window.progress_bar.setRange(0, 0)
+    values: list[int] = []
+    window.progress_bar.valueChanged.connect(values.append)
+
+    for value in (0.1, 0.2, 0.5):
+        window.update_progress(value)
+
+    assert window._progress_timer.isActive()
+    assert not values
+    window._flush_progress()
+    assert values == [50]
+    assert window.progress_bar.maximum() == 100
+    window._flush_progress()
+    assert values == [50]
+
+
+def test_log_is_batched(window: UserInterface) -> None:
+    """Log lines are collected and written to the log widget in one block.
+
+    Parameters:
+        window: A main window.
+    """
+    window.append_log("first")
+    window.append_log_batch(["second", "third"])
+
+    assert window._log_timer.isActive()
+    assert not window.log_edit.toPlainText()
+    window._flush_log()
+    assert window.log_edit.toPlainText() == "first\nsecond\nthird"
+    assert not window._log_buffer
+
+    window.append_log("pending")
+    window.clear_log()
+    window._flush_log()
+    assert not window.log_edit.toPlainText()
+
+
+def test_spinner_forgets_deleted(window: UserInterface) -> None:
+    """A running spinner deleted with its parent no longer drives the shared timer.
+
+    Parameters:
+        window: A main window.
+    """
+    parent = QWidget()
+    spinner = Spinner(16, parent)
+    spinner.start()
+    window.spinner.start()
+    assert Spinner._timer is not None
+    assert Spinner._timer.isActive()
+
+    parent.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    Spinner._advance()
+    assert Spinner._timer.isActive()
+
+    window.spinner.stop()
+    assert not Spinner._timer.isActive()